@@ -0,0 +1,115 @@
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import pandas as pd
+import numpy as np
+
+from data_validation import RAW_RULES, PROCESSED_RULES, validate
+from data_processing import calculate_per_game_stats, calculate_advanced_metrics, \
+    add_performance_categories, create_career_summary
+
+
+def make_league_data(n_rows=30000, seed=0):
+    """Build a clean, league-scale raw stats frame shaped like the API output"""
+    rng = np.random.default_rng(seed)
+    gp = rng.integers(1, 83, n_rows)
+
+    def totals(low, high):
+        # Per-game rate times games played, like a real season line
+        return (rng.uniform(low, high, n_rows) * gp).astype(int)
+
+    fga = totals(0, 22)
+    fgm = (fga * rng.uniform(0.35, 0.55, n_rows)).astype(int)
+    fg3a = (fga * rng.uniform(0, 0.45, n_rows)).astype(int)
+    fg3m = np.minimum((fg3a * rng.uniform(0.25, 0.42, n_rows)).astype(int), fgm)
+    fta = totals(0, 9)
+    ftm = (fta * rng.uniform(0.6, 0.9, n_rows)).astype(int)
+    oreb = totals(0, 4)
+    dreb = totals(0, 10)
+    seasons = np.array([f"{year}-{(year + 1) % 100:02d}" for year in range(1995, 2025)])
+
+    return pd.DataFrame({
+        'PLAYER_ID': np.arange(n_rows) // len(seasons),
+        'SEASON_ID': seasons[np.arange(n_rows) % len(seasons)],
+        'TEAM_ID': rng.integers(1, 31, n_rows),
+        'GP': gp,
+        'GS': gp // 2,
+        'MIN': gp * rng.integers(5, 40, n_rows),
+        'FGM': fgm, 'FGA': fga, 'FG_PCT': np.where(fga > 0, fgm / np.maximum(fga, 1), np.nan),
+        'FG3M': fg3m, 'FG3A': fg3a, 'FG3_PCT': np.where(fg3a > 0, fg3m / np.maximum(fg3a, 1), np.nan),
+        'FTM': ftm, 'FTA': fta, 'FT_PCT': np.where(fta > 0, ftm / np.maximum(fta, 1), np.nan),
+        'OREB': oreb, 'DREB': dreb, 'REB': oreb + dreb,
+        'AST': totals(0, 10),
+        'STL': totals(0, 2.5),
+        'BLK': totals(0, 2.5),
+        'TOV': totals(0, 4),
+        'PF': totals(0, 4),
+        'PTS': 2 * fgm + fg3m + ftm,
+        'PLAYER_NAME': [f"Player {i}" for i in np.arange(n_rows) // len(seasons)],
+    })
+
+
+def run_benchmark(n_rows=30000, repeats=5):
+    """Time validation against the rest of the processing pipeline"""
+    raw = make_league_data(n_rows)
+    validation_times, processing_times, io_times = [], [], []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_path = os.path.join(tmp, 'raw.csv')
+        raw.to_csv(raw_path, index=False)
+
+        for _ in range(repeats):
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                df = pd.read_csv(raw_path)
+                io_time = time.perf_counter() - start
+
+                start = time.perf_counter()
+                df, _, _ = validate(df, RAW_RULES)
+                validation_time = time.perf_counter() - start
+
+                start = time.perf_counter()
+                df = calculate_per_game_stats(df[df['GP'] > 0].copy())
+                df = calculate_advanced_metrics(df)
+                df = add_performance_categories(df)
+                processing_time = time.perf_counter() - start
+
+                start = time.perf_counter()
+                df, _, _ = validate(df, PROCESSED_RULES)
+                validation_time += time.perf_counter() - start
+
+                start = time.perf_counter()
+                career_summary = create_career_summary(df)
+                processing_time += time.perf_counter() - start
+
+                start = time.perf_counter()
+                df.to_csv(os.path.join(tmp, 'processed.csv'), index=False)
+                career_summary.to_csv(os.path.join(tmp, 'career.csv'))
+                io_time += time.perf_counter() - start
+
+            validation_times.append(validation_time)
+            processing_times.append(processing_time)
+            io_times.append(io_time)
+
+    # Median of repeats keeps one slow warm-up run from skewing the numbers
+    validation = np.median(validation_times) * 1000
+    processing = np.median(processing_times) * 1000
+    end_to_end = processing + validation + np.median(io_times) * 1000
+
+    compute_share = validation / processing
+    end_to_end_share = validation / end_to_end
+
+    print(f"=== Validation benchmark ({n_rows} rows, median of {repeats}) ===")
+    print(f"Validation:          {validation:8.1f} ms")
+    print(f"Processing steps:    {processing:8.1f} ms")
+    print(f"End to end (w/ CSV): {end_to_end:8.1f} ms")
+    print(f"\nValidation vs processing steps: {compute_share:.1%} "
+          f"({'meets' if compute_share < 0.05 else 'misses'} the 5% target)")
+    print(f"Validation vs end-to-end run incl. CSV I/O: {end_to_end_share:.1%} "
+          f"({'meets' if end_to_end_share < 0.05 else 'misses'} the 5% target)")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -1,21 +1,38 @@
 import pandas as pd
 import numpy as np
+from data_validation import RAW_RULES, PROCESSED_RULES, NUMERIC_COLUMNS, OPTIONAL_STATS, \
+    validate, print_report
 
 def load_and_clean_data():
-    """Load raw data and perform basic cleaning"""
+    """Load raw data, quarantine rows that fail validation and perform basic cleaning"""
     print("Loading and cleaning NBA data...")
     
     stats_df = pd.read_csv('data/raw/sample_player_stats.csv')
     
+    # Validate raw data - bad rows are set aside instead of being zero-filled
+    stats_df, quarantine, report = validate(stats_df, RAW_RULES)
+    print_report(report, "Raw data")
+    
+    # Rows with unparseable numbers were quarantined, so the rest convert cleanly
+    numeric_cols = [col for col in NUMERIC_COLUMNS if col in stats_df.columns]
+    stats_df[numeric_cols] = stats_df[numeric_cols].apply(pd.to_numeric)
+    
     # Basic cleaning
     # Remove rows where player didn't play (0 games played)
-    stats_df = stats_df[stats_df['GP'] > 0]
+    stats_df = stats_df[stats_df['GP'] > 0].copy()
+    
+    # Missing shooting percentages just mean no attempts
+    pct_cols = [col for col in stats_df.columns if col.endswith('_PCT')]
+    stats_df[pct_cols] = stats_df[pct_cols].fillna(0)
     
-    # Fill any missing values with 0
-    stats_df = stats_df.fillna(0)
+    # Optional stats left blank (era stats before they were tracked, GS, PF) are
+    # reported as 0, as the processed CSV always has. Required stats can't be
+    # missing here; anything else (e.g. PLAYER_AGE) stays NaN rather than a fake 0
+    optional_cols = [col for col in OPTIONAL_STATS if col in stats_df.columns]
+    stats_df[optional_cols] = stats_df[optional_cols].fillna(0)
     
-    print(f"Cleaned data: {len(stats_df)} player-seasons")
-    return stats_df
+    print(f"Cleaned data: {len(stats_df)} player-seasons ({len(quarantine)} quarantined)")
+    return stats_df, quarantine
 
 def calculate_per_game_stats(df):
     """Calculate per-game averages"""
@@ -59,17 +76,14 @@ def add_performance_categories(df):
     print("Adding performance categories...")
     
     # Only categorize seasons where player played significant minutes
-    active_seasons = df[df['MPG'] >= 15].copy()
+    active_seasons = df[df['MPG'] >= 15]
     
     if len(active_seasons) > 0:
-        # Create scoring tiers based on PPG
-        active_seasons['SCORING_TIER'] = pd.cut(active_seasons['PPG'], 
-                                               bins=[0, 10, 15, 20, 25, 50], 
-                                               labels=['Bench', 'Role Player', 'Starter', 'Star', 'Superstar'])
-        
-        # Merge back to main dataframe
-        df = df.merge(active_seasons[['PLAYER_NAME', 'SEASON_ID', 'SCORING_TIER']], 
-                     on=['PLAYER_NAME', 'SEASON_ID'], how='left')
+        # Create scoring tiers based on PPG. Assigned by index so traded players'
+        # per-team rows each keep their own tier (inactive seasons stay NaN)
+        df['SCORING_TIER'] = pd.cut(active_seasons['PPG'], 
+                                    bins=[0, 10, 15, 20, 25, 50], 
+                                    labels=['Bench', 'Role Player', 'Starter', 'Star', 'Superstar'])
     
     return df
 
@@ -119,8 +133,8 @@ def main():
     """Main processing pipeline"""
     print("=== NBA Data Processing Pipeline ===\n")
     
-    # Step 1: Load and clean
-    df = load_and_clean_data()
+    # Step 1: Load, validate and clean
+    df, raw_quarantine = load_and_clean_data()
     
     # Step 2: Calculate per-game stats
     df = calculate_per_game_stats(df)
@@ -131,6 +145,10 @@ def main():
     # Step 4: Add performance categories
     df = add_performance_categories(df)
     
+    # Validate derived metrics before anything is summarized
+    df, processed_quarantine, report = validate(df, PROCESSED_RULES)
+    print_report(report, "Processed data")
+    
     # Step 5: Create career summary
     career_summary = create_career_summary(df)
     
@@ -139,9 +157,13 @@ def main():
     df.to_csv('data/processed/player_stats_processed.csv', index=False)
     career_summary.to_csv('data/processed/career_summaries.csv')
     
+    quarantine = pd.concat([raw_quarantine, processed_quarantine], ignore_index=True)
+    quarantine.to_csv('data/processed/quarantined_rows.csv', index=False)
+    
     print(f"\nProcessing complete!")
     print(f"Processed {len(df)} player-seasons")
     print(f"Career summaries for {len(career_summary)} players")
+    print(f"Quarantined {len(quarantine)} rows for review")
     
     # Show sample results
     print("\nSample processed data:")
@@ -0,0 +1,238 @@
+import time
+
+import pandas as pd
+import numpy as np
+
+# Declarative data-quality rules. Each rule is (name, check, *args) where
+# check is one of the kinds understood by compile_rules() below.
+#   not_null      cols           - column must exist and every value be present
+#   numeric       cols           - present values must parse as numbers
+#   tracked_since first_seasons  - value must be present from the season the
+#                                  league started tracking it
+#   non_negative  cols           - value must be >= 0
+#   not_greater   part, whole    - part must be <= whole (e.g. FGM <= FGA)
+#   equals        target, terms  - target must equal the weighted sum of terms
+#   in_range      cols, lo, hi   - value must be finite and within [lo, hi]
+#   unique        keys           - key combination must appear only once
+
+COUNTING_STATS = ['GP', 'MIN', 'FGM', 'FGA', 'FG3M', 'FG3A', 'FTM', 'FTA',
+                  'REB', 'AST', 'STL', 'BLK', 'TOV', 'PTS']
+
+# Stats the league only started recording later - the API returns NaN for
+# earlier seasons, which is expected rather than bad data
+STAT_FIRST_SEASON = {
+    'OREB': 1973, 'DREB': 1973, 'STL': 1973, 'BLK': 1973,
+    'TOV': 1977, 'FG3M': 1979, 'FG3A': 1979,
+}
+
+REQUIRED_COLUMNS = ['PLAYER_ID', 'SEASON_ID', 'TEAM_ID', 'GP', 'MIN', 'FGM', 'FGA',
+                    'FTM', 'FTA', 'REB', 'AST', 'PTS']
+
+# Stats that may be blank without the row being bad - era stats before they
+# were tracked, plus games started and fouls the API sometimes omits
+OPTIONAL_STATS = list(STAT_FIRST_SEASON) + ['GS', 'PF']
+
+NUMERIC_COLUMNS = ['PLAYER_ID', 'TEAM_ID', 'PLAYER_AGE'] + COUNTING_STATS + \
+                  ['OREB', 'DREB', 'GS', 'PF', 'FG_PCT', 'FG3_PCT', 'FT_PCT']
+
+RAW_RULES = [
+    ('missing_required_value', 'not_null', REQUIRED_COLUMNS),
+    ('non_numeric_value', 'numeric', NUMERIC_COLUMNS),
+    ('missing_tracked_stat', 'tracked_since', STAT_FIRST_SEASON),
+    ('negative_counting_stat', 'non_negative', COUNTING_STATS + ['OREB', 'DREB', 'GS', 'PF']),
+    ('fgm_exceeds_fga', 'not_greater', 'FGM', 'FGA'),
+    ('fg3m_exceeds_fg3a', 'not_greater', 'FG3M', 'FG3A'),
+    ('ftm_exceeds_fta', 'not_greater', 'FTM', 'FTA'),
+    ('fg3m_exceeds_fgm', 'not_greater', 'FG3M', 'FGM'),
+    ('fg3a_exceeds_fga', 'not_greater', 'FG3A', 'FGA'),
+    ('gs_exceeds_gp', 'not_greater', 'GS', 'GP'),
+    ('points_mismatch', 'equals', 'PTS', [('FGM', 2), ('FG3M', 1), ('FTM', 1)]),
+    ('rebounds_mismatch', 'equals', 'REB', [('OREB', 1), ('DREB', 1)]),
+    ('duplicate_player_season_team', 'unique', ['PLAYER_ID', 'SEASON_ID', 'TEAM_ID']),
+]
+
+PROCESSED_RULES = [
+    ('per_game_out_of_range', 'in_range', ['PPG', 'RPG', 'APG', 'SPG', 'BPG'], 0, 100),
+    ('mpg_out_of_range', 'in_range', ['MPG'], 0, 60),
+    ('ts_pct_out_of_range', 'in_range', ['TS_PCT'], 0, 1.5),
+    ('non_finite_metric', 'in_range', ['EFFICIENCY', 'EFF_PER_MIN', 'USAGE_EST'], -np.inf, np.inf),
+]
+
+
+def _numeric(df, col, cache):
+    """Pull a column out as a float array once and reuse it across rules"""
+    if col not in cache:
+        series = df[col]
+        if not pd.api.types.is_numeric_dtype(series):
+            series = pd.to_numeric(series, errors='coerce')
+        if isinstance(series.dtype, np.dtype):
+            # Plain numpy columns convert directly - na_value forces a NaN scan
+            cache[col] = series.to_numpy(dtype=float)
+        else:
+            cache[col] = series.to_numpy(dtype=float, na_value=np.nan)
+    return cache[col]
+
+
+def _codes(df, col, cache):
+    """Factorize a column once - shared by the season lookup and the uniqueness check"""
+    key = ('codes', col)
+    if key not in cache:
+        cache[key] = pd.factorize(df[col])
+    return cache[key]
+
+
+def required_columns(rules):
+    """Columns a frame must have before its rows can be checked at all"""
+    return [col for _, kind, *args in rules if kind == 'not_null' for col in args[0]]
+
+
+def compile_rules(rules):
+    """Turn a rule list into checks that each return a boolean violation mask.
+
+    Apart from not_null columns, which validate() requires up front, rules
+    referencing columns absent from a frame are skipped, so the same rule set
+    works on older API responses with fewer columns.
+    """
+    compiled = []
+    for name, kind, *args in rules:
+        if kind == 'not_null':
+            def check(df, cache, cols=args[0]):
+                mask = np.zeros(len(df), dtype=bool)
+                for col in cols:
+                    if pd.api.types.is_numeric_dtype(df[col]):
+                        mask |= np.isnan(_numeric(df, col, cache))
+                    else:
+                        # Factorizing marks missing values -1 and is reused by
+                        # the season lookup and uniqueness check
+                        mask |= _codes(df, col, cache)[0] == -1
+                return mask
+        elif kind == 'numeric':
+            def check(df, cache, cols=args[0]):
+                mask = np.zeros(len(df), dtype=bool)
+                for col in cols:
+                    # Numeric dtypes can't hold stray strings, so only object
+                    # columns from a bad CSV cost anything here
+                    if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+                        mask |= df[col].notna().to_numpy() & np.isnan(_numeric(df, col, cache))
+                return mask
+        elif kind == 'tracked_since':
+            def check(df, cache, first_seasons=args[0]):
+                if 'SEASON_ID' not in df.columns:
+                    return None
+                if '_SEASON_YEAR' not in cache:
+                    # Only a few dozen distinct seasons, so parse each once
+                    codes, seasons = _codes(df, 'SEASON_ID', cache)
+                    years = pd.to_numeric(pd.Series(seasons, dtype=str).str[:4], errors='coerce')
+                    years = np.append(years.to_numpy(dtype=float, na_value=np.nan), np.nan)
+                    cache['_SEASON_YEAR'] = years[codes]  # code -1 (missing) maps to NaN
+                season_year = cache['_SEASON_YEAR']
+                mask = np.zeros(len(df), dtype=bool)
+                for col, first_season in first_seasons.items():
+                    if col in df.columns:
+                        mask |= np.isnan(_numeric(df, col, cache)) & (season_year >= first_season)
+                return mask
+        elif kind == 'non_negative':
+            def check(df, cache, cols=args[0]):
+                mask = np.zeros(len(df), dtype=bool)
+                for col in cols:
+                    if col in df.columns:
+                        mask |= _numeric(df, col, cache) < 0
+                return mask
+        elif kind == 'not_greater':
+            def check(df, cache, part=args[0], whole=args[1]):
+                if part not in df.columns or whole not in df.columns:
+                    return None
+                return _numeric(df, part, cache) > _numeric(df, whole, cache)
+        elif kind == 'equals':
+            def check(df, cache, target=args[0], terms=args[1]):
+                if any(col not in df.columns for col in [target] + [t[0] for t in terms]):
+                    return None
+                total = sum(weight * _numeric(df, col, cache) for col, weight in terms)
+                # NaN comparisons are False, so seasons missing a component pass
+                return np.abs(_numeric(df, target, cache) - total) > 1e-6
+        elif kind == 'in_range':
+            def check(df, cache, cols=args[0], lo=args[1], hi=args[2]):
+                mask = np.zeros(len(df), dtype=bool)
+                for col in cols:
+                    if col in df.columns:
+                        values = _numeric(df, col, cache)
+                        with np.errstate(invalid='ignore'):
+                            mask |= ~((values >= lo) & (values <= hi) & np.isfinite(values))
+                return mask
+        elif kind == 'unique':
+            def check(df, cache, keys=args[0]):
+                if any(key not in df.columns for key in keys):
+                    return None
+                # Pack the factorized keys into one integer per row, then keep
+                # the first occurrence and quarantine the repeats
+                combined = np.zeros(len(df), dtype=np.int64)
+                for key in keys:
+                    codes, uniques = _codes(df, key, cache)
+                    combined = combined * (len(uniques) + 1) + (codes + 1)
+                return pd.Series(combined).duplicated(keep='first').to_numpy()
+        else:
+            raise ValueError(f"Unknown rule type '{kind}' for rule '{name}'")
+        compiled.append((name, check))
+    return compiled
+
+
+def validate(df, rules, sample_size=5):
+    """Run all rules in one pass and split the frame into clean and quarantined rows.
+
+    Raises ValueError if a required column is absent, since no row can be
+    trusted then. Returns (clean_df, quarantine_df, report_df). The quarantine frame keeps
+    the original row plus a VIOLATIONS column naming the failed rules, and the
+    report lists the violation count and a few sample row indices per rule.
+    """
+    start = time.perf_counter()
+    missing = [col for col in required_columns(rules) if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+    compiled = compile_rules(rules)
+
+    cache = {}
+    names = []
+    masks = np.zeros((len(compiled), len(df)), dtype=bool)
+    for i, (name, check) in enumerate(compiled):
+        names.append(name)
+        mask = check(df, cache)
+        if mask is not None:
+            masks[i] = mask
+
+    counts = masks.sum(axis=1)
+    bad_rows = masks.any(axis=0)
+    index = df.index.to_numpy()
+
+    report = pd.DataFrame({
+        'RULE': names,
+        'VIOLATIONS': counts,
+        'SAMPLE_ROWS': [index[m][:sample_size].tolist() for m in masks],
+    })
+
+    # Clean frames are the common case, so only copy rows when something failed
+    if bad_rows.any():
+        # Label each distinct combination of failed rules once, not every row
+        bits = np.left_shift(1, np.arange(len(names), dtype=np.int64))
+        patterns, inverse = np.unique(bits @ masks[:, bad_rows], return_inverse=True)
+        labels = np.array([';'.join(name for name, bit in zip(names, bits) if pattern & bit)
+                           for pattern in patterns], dtype=object)
+        quarantine = df.take(np.flatnonzero(bad_rows))
+        quarantine['VIOLATIONS'] = labels[inverse]
+        df = df.take(np.flatnonzero(~bad_rows))
+    else:
+        quarantine = df.iloc[:0].assign(VIOLATIONS=pd.Series(dtype=object))
+
+    report.attrs['elapsed_ms'] = (time.perf_counter() - start) * 1000
+    return df, quarantine, report
+
+
+def print_report(report, label):
+    """Print a short summary of a validation report"""
+    failed = report[report['VIOLATIONS'] > 0]
+    elapsed = report.attrs.get('elapsed_ms', 0)
+    if failed.empty:
+        print(f"{label} validation: all {len(report)} rules passed ({elapsed:.1f} ms)")
+        return
+    print(f"{label} validation: {len(failed)} of {len(report)} rules failed ({elapsed:.1f} ms)")
+    for _, row in failed.iterrows():
+        print(f"   - {row['RULE']}: {row['VIOLATIONS']} rows (e.g. rows {row['SAMPLE_ROWS']})")
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from data_processing import load_and_clean_data, calculate_per_game_stats, calculate_advanced_metrics
+from test_data_validation import make_season
+
+
+def write_raw(tmp_path, monkeypatch, df):
+    (tmp_path / 'data' / 'raw').mkdir(parents=True)
+    df.to_csv(tmp_path / 'data' / 'raw' / 'sample_player_stats.csv', index=False)
+    monkeypatch.chdir(tmp_path)
+
+
+def test_bad_strings_are_quarantined_and_the_rest_stays_numeric(tmp_path, monkeypatch):
+    df = pd.DataFrame([make_season(), make_season(TEAM_ID=20)])
+    df['FGA'] = df['FGA'].astype(object)
+    df.loc[1, 'FGA'] = 'abc'
+    write_raw(tmp_path, monkeypatch, df)
+
+    stats_df, quarantine = load_and_clean_data()
+
+    assert quarantine['TEAM_ID'].tolist() == [20]
+    assert pd.api.types.is_numeric_dtype(stats_df['FGA'])
+    # Downstream arithmetic must work on what survives
+    calculate_advanced_metrics(calculate_per_game_stats(stats_df))
+
+
+def test_optional_stats_zero_filled_other_gaps_left_missing(tmp_path, monkeypatch):
+    df = pd.DataFrame([
+        make_season(SEASON_ID='1975-76', FG3M=np.nan, FG3A=np.nan, TOV=np.nan,
+                    GS=np.nan, PLAYER_AGE=np.nan),
+        make_season(TEAM_ID=20, PLAYER_AGE=27.0),
+    ])
+    write_raw(tmp_path, monkeypatch, df)
+
+    stats_df, quarantine = load_and_clean_data()
+
+    assert quarantine.empty
+    assert stats_df.loc[0, ['FG3M', 'FG3A', 'TOV', 'GS']].tolist() == [0, 0, 0, 0]
+    assert np.isnan(stats_df.loc[0, 'PLAYER_AGE'])
@@ -0,0 +1,189 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_validation import RAW_RULES, PROCESSED_RULES, compile_rules, validate
+from data_processing import add_performance_categories
+
+
+def make_season(**overrides):
+    """One internally consistent raw player-season row"""
+    row = dict(PLAYER_ID=1, SEASON_ID='2020-21', TEAM_ID=10, GP=50, GS=40, MIN=1500,
+               FGM=300, FGA=600, FG3M=80, FG3A=200, FTM=100, FTA=120,
+               OREB=40, DREB=160, REB=200, AST=150, STL=40, BLK=20, TOV=80, PF=100)
+    row.update(overrides)
+    if 'PTS' not in overrides:
+        fg3m = 0 if pd.isna(row['FG3M']) else row['FG3M']
+        row['PTS'] = 2 * row['FGM'] + fg3m + row['FTM']
+    return row
+
+
+def counts(report):
+    return dict(zip(report['RULE'], report['VIOLATIONS']))
+
+
+def test_clean_frame_passes_without_copying_rows():
+    df = pd.DataFrame([make_season(), make_season(TEAM_ID=20)])
+    clean, quarantine, report = validate(df, RAW_RULES)
+
+    assert clean is df
+    assert quarantine.empty
+    assert 'VIOLATIONS' in quarantine.columns
+    assert report['VIOLATIONS'].sum() == 0
+
+
+def test_empty_frame():
+    df = pd.DataFrame([make_season()]).iloc[:0]
+    clean, quarantine, report = validate(df, RAW_RULES)
+
+    assert clean.empty and quarantine.empty
+    assert len(report) == len(RAW_RULES)
+    assert report['VIOLATIONS'].sum() == 0
+
+
+def test_not_null_only_checks_required_columns():
+    df = pd.DataFrame([make_season(PTS=np.nan), make_season(TEAM_ID=20, PF=np.nan)])
+    _, quarantine, report = validate(df, RAW_RULES)
+
+    assert counts(report)['missing_required_value'] == 1
+    assert quarantine.index.tolist() == [0]
+
+
+def test_tracked_since_allows_gaps_before_stat_existed():
+    df = pd.DataFrame([
+        make_season(SEASON_ID='1975-76', FG3M=np.nan, FG3A=np.nan, TOV=np.nan),
+        make_season(SEASON_ID='1978-79', FG3M=np.nan, FG3A=np.nan, TOV=np.nan),
+        make_season(SEASON_ID='2001-02', STL=np.nan),
+    ])
+    _, quarantine, report = validate(df, RAW_RULES)
+
+    # 1978-79 is missing TOV, which was tracked from 1977-78
+    assert counts(report)['missing_tracked_stat'] == 2
+    assert quarantine.index.tolist() == [1, 2]
+
+
+def test_non_negative():
+    df = pd.DataFrame([make_season(MIN=-5), make_season(TEAM_ID=20)])
+    _, _, report = validate(df, RAW_RULES)
+
+    assert counts(report)['negative_counting_stat'] == 1
+
+
+def test_not_greater():
+    df = pd.DataFrame([make_season(FTM=130), make_season(TEAM_ID=20, GS=60)])
+    _, quarantine, report = validate(df, RAW_RULES)
+
+    assert counts(report)['ftm_exceeds_fta'] == 1
+    assert counts(report)['gs_exceeds_gp'] == 1
+    assert len(quarantine) == 2
+
+
+def test_equals_lets_missing_components_pass():
+    df = pd.DataFrame([
+        make_season(PTS=1),
+        make_season(TEAM_ID=20, OREB=np.nan, DREB=np.nan),
+    ])
+    _, _, report = validate(df, RAW_RULES)
+
+    assert counts(report)['points_mismatch'] == 1
+    assert counts(report)['rebounds_mismatch'] == 0
+
+
+def test_in_range_rejects_nan_and_infinite_values():
+    df = pd.DataFrame({
+        'PPG': [20.0, -1.0, 30.0, 10.0],
+        'TS_PCT': [0.55, 0.5, np.nan, 0.6],
+        'EFF_PER_MIN': [0.5, 0.4, 0.6, np.inf],
+    })
+    _, quarantine, report = validate(df, PROCESSED_RULES)
+
+    assert counts(report)['per_game_out_of_range'] == 1
+    assert counts(report)['ts_pct_out_of_range'] == 1
+    assert counts(report)['non_finite_metric'] == 1
+    assert quarantine.index.tolist() == [1, 2, 3]
+
+
+def test_unique_keeps_first_occurrence():
+    df = pd.DataFrame([make_season(), make_season(TEAM_ID=0), make_season()])
+    clean, quarantine, report = validate(df, RAW_RULES)
+
+    assert counts(report)['duplicate_player_season_team'] == 1
+    assert clean.index.tolist() == [0, 1]
+    assert quarantine.index.tolist() == [2]
+
+
+def test_missing_required_column_fails_before_row_checks():
+    df = pd.DataFrame({'FGM': [5, 10], 'FGA': [8, 4]})
+
+    with pytest.raises(ValueError, match='Missing required columns: PLAYER_ID.*MIN'):
+        validate(df, RAW_RULES)
+
+
+def test_rules_skip_missing_optional_columns():
+    df = pd.DataFrame([make_season(), make_season(TEAM_ID=20, FGM=700)])
+    df = df.drop(columns=['OREB', 'DREB', 'GS', 'FG3M', 'FG3A', 'STL', 'TOV'])
+    _, quarantine, report = validate(df, RAW_RULES)
+
+    assert counts(report) == {**{rule[0]: 0 for rule in RAW_RULES}, 'fgm_exceeds_fga': 1}
+    assert quarantine.index.tolist() == [1]
+
+
+def test_unparseable_values_are_quarantined():
+    df = pd.DataFrame([make_season(), make_season(TEAM_ID=20), make_season(TEAM_ID=30)])
+    df['FGA'] = df['FGA'].astype(object)
+    df.loc[1, 'FGA'] = 'abc'
+    df['GS'] = df['GS'].astype(object)
+    df.loc[2, 'GS'] = 'n/a'
+    clean, quarantine, report = validate(df, RAW_RULES)
+
+    assert counts(report)['non_numeric_value'] == 2
+    assert quarantine['VIOLATIONS'].to_dict() == {1: 'non_numeric_value', 2: 'non_numeric_value'}
+    assert clean.index.tolist() == [0]
+
+
+def test_string_numbers_still_count_as_present():
+    df = pd.DataFrame([make_season(), make_season(TEAM_ID=20)]).astype({'MIN': str})
+    _, quarantine, _ = validate(df, RAW_RULES)
+
+    assert quarantine.empty
+
+
+def test_violation_labels_and_samples():
+    df = pd.DataFrame([
+        make_season(FGM=700),                      # fgm_exceeds_fga + points_mismatch
+        make_season(TEAM_ID=20, MIN=-1),
+        make_season(TEAM_ID=30),
+        make_season(TEAM_ID=40, FGM=700, PTS=5),   # same pattern as the first row
+    ], index=[10, 11, 12, 13])
+    df.loc[10, 'PTS'] = 0
+    clean, quarantine, report = validate(df, RAW_RULES)
+
+    assert clean.index.tolist() == [12]
+    assert quarantine['VIOLATIONS'].to_dict() == {
+        10: 'fgm_exceeds_fga;points_mismatch',
+        11: 'negative_counting_stat',
+        13: 'fgm_exceeds_fga;points_mismatch',
+    }
+    samples = dict(zip(report['RULE'], report['SAMPLE_ROWS']))
+    assert samples['fgm_exceeds_fga'] == [10, 13]
+
+
+def test_unknown_rule_type():
+    with pytest.raises(ValueError, match='bogus'):
+        compile_rules([('bogus', 'not_a_check', ['GP'])])
+
+
+def test_scoring_tiers_do_not_multiply_traded_player_rows():
+    df = pd.DataFrame({
+        'PLAYER_NAME': ['X', 'X', 'X'],
+        'SEASON_ID': ['2020-21'] * 3,
+        'TEAM_ID': [10, 20, 0],
+        'MPG': [30.0, 20.0, 26.0],
+        'PPG': [22.0, 12.0, 18.0],
+    }, index=[4, 7, 9])
+    df = add_performance_categories(df)
+
+    assert df.index.tolist() == [4, 7, 9]
+    assert df['SCORING_TIER'].tolist() == ['Star', 'Role Player', 'Starter']
+    _, quarantine, _ = validate(df, PROCESSED_RULES)
+    assert quarantine.empty